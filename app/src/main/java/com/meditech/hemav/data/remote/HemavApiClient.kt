@@ -9,6 +9,7 @@ import okhttp3.Request
 import okhttp3.RequestBody.Companion.toRequestBody
 import org.json.JSONArray
 import org.json.JSONObject
+import java.util.TimeZone
 import java.util.concurrent.TimeUnit
 
 /**
@@ -125,6 +126,7 @@ object HemavApiClient {
         time: String,
         type: String,
         notes: String,
+        timestamp: Long = 0L,
     ): JSONObject {
         val body = JSONObject().apply {
             put("doctor_id", doctorId)
@@ -132,6 +134,9 @@ object HemavApiClient {
             put("time", time)
             put("type", type)
             put("notes", notes)
+            // Scheduled time in epoch ms from the device clock/timezone
+            if (timestamp > 0) put("timestamp", timestamp)
+            put("utc_offset_minutes", TimeZone.getDefault().getOffset(System.currentTimeMillis()) / 60_000)
         }
         return postAuth("/appointments/", body)
     }
@@ -0,0 +1,226 @@
+"""
+HemaV Backend - Data Retention & Archival
+Moves old scans, messages and finished appointments out of the hot collections
+on a schedule so the working set stays small. Records go to zstd-compressed
+`<name>_archive` collections in bulk batches; history endpoints fall back to
+them via `read_archive` / `find_archived`.
+
+If `archive_export_dir` is set, each batch is also appended to gzipped JSONL
+files there as a cold export (e.g. for backups once the archive TTL expires).
+The export is write-only: it is never read back, and records are only removed
+from the hot collection after they are in the Mongo archive.
+"""
+import asyncio
+import gzip
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+from bson import json_util
+from pymongo.errors import BulkWriteError, CollectionInvalid, DuplicateKeyError, OperationFailure, PyMongoError
+from app.config import get_settings
+from app.database import get_db, archive_collection, archive_state_collection
+
+settings = get_settings()
+
+# collection -> (date field, days before archiving, extra filter, fields indexed for history reads)
+POLICIES = {
+    "scans": ("created_at", settings.archive_scans_after_days, {}, ["user_id"]),
+    "messages": ("timestamp", settings.archive_messages_after_days, {}, ["chat_id"]),
+    "appointments": (
+        "created_at",
+        settings.archive_appointments_after_days,
+        {"status": {"$in": ["COMPLETED", "CANCELLED"]}},
+        ["patient_id", "doctor_id"],
+    ),
+}
+
+LOCK_ID = "lock"
+LOCK_HOURS = 1
+
+_scheduler: Optional[asyncio.Task] = None
+
+
+# ─── Indexes ──────────────────────────────────────────
+async def _sync_ttl_index(archive, date_field: str):
+    """Make the archive's date index match `archive_ttl_days` (0 = no TTL).
+    A stale TTL would keep deleting archived medical records, so mismatches are
+    fixed via collMod, or by dropping and recreating the index, never ignored."""
+    want = settings.archive_ttl_days * 86400 if settings.archive_ttl_days > 0 else None
+    index_name = f"{date_field}_1"
+    existing = (await archive.index_information()).get(index_name)
+    if existing is None:
+        if want is None:
+            await archive.create_index(date_field)
+        else:
+            await archive.create_index(date_field, expireAfterSeconds=want)
+        return
+    if existing.get("expireAfterSeconds") == want:
+        return
+
+    if want is not None:
+        try:
+            await get_db().command({
+                "collMod": archive.name,
+                "index": {"name": index_name, "expireAfterSeconds": want},
+            })
+            print(f"🗄️ {archive.name}.{date_field} TTL set to {settings.archive_ttl_days} days")
+            return
+        except OperationFailure:
+            pass  # Older servers can't turn a plain index into a TTL index
+    # collMod cannot remove expireAfterSeconds, so rebuild the index
+    await archive.drop_index(index_name)
+    if want is None:
+        await archive.create_index(date_field)
+    else:
+        await archive.create_index(date_field, expireAfterSeconds=want)
+    print(f"🗄️ {archive.name}.{date_field} TTL set to {settings.archive_ttl_days or 'none'} days")
+
+
+async def ensure_archive_indexes():
+    """Hot-collection cutoff indexes, compressed archive collections and TTL"""
+    db = get_db()
+    existing = await db.list_collection_names()
+    for name, (date_field, _, _, user_fields) in POLICIES.items():
+        await db[name].create_index(date_field)
+
+        archive_name = archive_collection(name).name
+        if archive_name not in existing:
+            try:
+                await db.create_collection(
+                    archive_name,
+                    storageEngine={"wiredTiger": {"configString": "block_compressor=zstd"}},
+                )
+            except CollectionInvalid:
+                pass  # Created concurrently by another instance
+
+        archive = archive_collection(name)
+        for field in user_fields:
+            await archive.create_index([(field, 1), (date_field, -1)])
+        await _sync_ttl_index(archive, date_field)
+
+
+# ─── JSONL Export ─────────────────────────────────────
+def _export_jsonl(name: str, date_field: str, docs: list[dict]):
+    """Append docs to one gzipped JSONL file per month"""
+    directory = os.path.join(settings.archive_export_dir, name)
+    os.makedirs(directory, exist_ok=True)
+    by_month: dict[str, list[str]] = {}
+    for doc in docs:
+        month = doc[date_field].strftime("%Y-%m")
+        by_month.setdefault(month, []).append(json_util.dumps(doc))
+    for month, lines in by_month.items():
+        path = os.path.join(directory, f"{month}.jsonl.gz")
+        with gzip.open(path, "at", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+# ─── Fallback Reads ───────────────────────────────────
+async def read_archive(name: str, query: dict, limit: int) -> list[dict]:
+    """Archived records matching `query`, newest first (indexed Mongo read)"""
+    if limit <= 0:
+        return []
+    date_field = POLICIES[name][0]
+    cursor = archive_collection(name).find(query).sort(date_field, -1).limit(limit)
+    return [doc async for doc in cursor]
+
+
+async def find_archived(name: str, query: dict) -> Optional[dict]:
+    docs = await read_archive(name, query, limit=1)
+    return docs[0] if docs else None
+
+
+# ─── Archival Job ─────────────────────────────────────
+async def _archive_collection(name: str) -> int:
+    date_field, after_days, extra_filter, _ = POLICIES[name]
+    cutoff = datetime.utcnow() - timedelta(days=after_days)
+    query = {date_field: {"$lt": cutoff}, **extra_filter}
+    hot = get_db()[name]
+    moved = 0
+
+    while True:
+        docs = await hot.find(query).sort(date_field, 1).limit(settings.archive_batch_size).to_list(None)
+        if not docs:
+            return moved
+
+        try:
+            await archive_collection(name).insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            # Already archived by an interrupted earlier run; anything else is fatal
+            if any(err["code"] != 11000 for err in e.details["writeErrors"]):
+                raise
+        if settings.archive_export_dir:
+            await asyncio.to_thread(_export_jsonl, name, date_field, docs)
+
+        await hot.delete_many({"_id": {"$in": [d["_id"] for d in docs]}})
+        moved += len(docs)
+        await asyncio.sleep(0)
+
+
+async def _acquire_lock(min_interval: timedelta) -> bool:
+    """Lease so only one API instance archives at a time (and not again within `min_interval`)"""
+    now = datetime.utcnow()
+    try:
+        await archive_state_collection().find_one_and_update(
+            {
+                "_id": LOCK_ID,
+                "locked_until": {"$lt": now},
+                "$or": [{"last_run": {"$exists": False}}, {"last_run": {"$lt": now - min_interval}}],
+            },
+            {"$set": {"locked_until": now + timedelta(hours=LOCK_HOURS), "last_run": now}},
+            upsert=True,
+        )
+        return True
+    except DuplicateKeyError:
+        return False
+
+
+async def _release_lock():
+    await archive_state_collection().update_one(
+        {"_id": LOCK_ID},
+        {"$set": {"locked_until": datetime.utcnow()}},
+    )
+
+
+async def run_archival(force: bool = False) -> dict:
+    """One archival pass over every policy; returns records moved per collection"""
+    min_interval = timedelta(0) if force else timedelta(hours=settings.archive_interval_hours)
+    if not await _acquire_lock(min_interval):
+        return {}
+    try:
+        moved = {name: await _archive_collection(name) for name in POLICIES}
+    finally:
+        await _release_lock()
+    print(f"🗄️ Archived records: {moved}")
+    return moved
+
+
+async def _run():
+    indexes_ready = False
+    while True:
+        try:
+            # Don't archive into collections whose TTL doesn't match the config
+            if not indexes_ready:
+                await ensure_archive_indexes()
+                indexes_ready = True
+            await run_archival()
+        except (PyMongoError, OSError) as e:
+            print(f"⚠️ Archival failed: {e}")
+        await asyncio.sleep(settings.archive_interval_hours * 3600)
+
+
+async def start_archival():
+    """Start the archival scheduler on startup"""
+    global _scheduler
+    if settings.archive_enabled and _scheduler is None:
+        _scheduler = asyncio.create_task(_run())
+
+
+async def stop_archival():
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.cancel()
+        try:
+            await _scheduler
+        except asyncio.CancelledError:
+            pass
+        _scheduler = None
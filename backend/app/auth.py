@@ -2,26 +2,34 @@
 HemaV Backend - JWT Authentication Utilities
 """
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.config import get_settings
 
+# passlib/bcrypt and python-jose are imported on first use (or during
+# app.startup.warmup) to keep module import off the cold-start path.
+
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
 
+@lru_cache()
+def get_pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+    return get_pwd_context().verify(plain, hashed)
 
 
 def create_token(user_id: str, role: str) -> str:
+    from jose import jwt
     expire = datetime.utcnow() + timedelta(hours=settings.jwt_expiry_hours)
     payload = {
         "sub": user_id,
@@ -32,6 +40,7 @@ def create_token(user_id: str, role: str) -> str:
 
 
 def decode_token(token: str) -> dict:
+    from jose import JWTError, jwt
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
         return payload
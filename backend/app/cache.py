@@ -0,0 +1,78 @@
+"""
+HemaV Backend - Per-User Response Cache
+Small in-process TTL cache for aggregate reads (e.g. /home). Routes that
+write data shown in those reads call `invalidate_user` for affected users,
+and the appointment watcher in app.notifications does the same for changes
+made by other workers/instances. Other cross-instance writes are bounded by
+the TTL.
+
+Each invalidation stamps the user with a fresh generation from a global
+counter. Readers take the generation before querying and `set_home` drops
+the result if it changed meanwhile, so a fill that raced with a write never
+caches the pre-write summary. Generations of users with nothing cached are
+pruned once older than the TTL; `_floor` (the highest pruned generation)
+is then reported for them, so a pruned-and-reset user can never match a
+reader's pre-write generation.
+"""
+import itertools
+import time
+from app.config import get_settings
+
+settings = get_settings()
+
+MAX_ENTRIES = 10000
+
+# user_id -> (expires_at, value), in insertion order (oldest first)
+_home_cache: dict[str, tuple[float, dict]] = {}
+# user_id -> (generation, invalidated_at)
+_generations: dict[str, tuple[int, float]] = {}
+_counter = itertools.count(1)
+_floor = 0
+
+
+def get_home(user_id: str):
+    entry = _home_cache.get(user_id)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        _home_cache.pop(user_id, None)
+        return None
+    return value
+
+
+def home_generation(user_id: str) -> int:
+    entry = _generations.get(user_id)
+    return entry[0] if entry else _floor
+
+
+def _prune(now: float):
+    global _floor
+    for key in [k for k, (expires_at, _) in _home_cache.items() if expires_at < now]:
+        del _home_cache[key]
+    # Still full: evict the oldest entries
+    while len(_home_cache) >= MAX_ENTRIES:
+        del _home_cache[next(iter(_home_cache))]
+
+    cutoff = now - settings.home_cache_ttl_seconds
+    for user_id, (generation, invalidated_at) in list(_generations.items()):
+        if invalidated_at < cutoff and user_id not in _home_cache:
+            del _generations[user_id]
+            _floor = max(_floor, generation)
+
+
+def set_home(user_id: str, value: dict, generation: int):
+    if home_generation(user_id) != generation:
+        return  # Invalidated while the value was being built
+    now = time.monotonic()
+    if len(_home_cache) >= MAX_ENTRIES or len(_generations) >= MAX_ENTRIES:
+        _prune(now)
+    _home_cache.pop(user_id, None)
+    _home_cache[user_id] = (now + settings.home_cache_ttl_seconds, value)
+
+
+def invalidate_user(*user_ids: str):
+    for user_id in user_ids:
+        if user_id:
+            _generations[user_id] = (next(_counter), time.monotonic())
+            _home_cache.pop(user_id, None)
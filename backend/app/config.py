@@ -10,6 +10,16 @@ class Settings(BaseSettings):
     # MongoDB
     mongodb_uri: str = "mongodb://localhost:27017"
     db_name: str = "hemav"
+    mongodb_min_pool_size: int = 4
+    mongodb_max_pool_size: int = 100
+
+    # Health probes
+    health_check_interval_seconds: float = 10.0
+    health_check_timeout_seconds: float = 2.0
+    shutdown_drain_seconds: float = 5.0
+
+    # Startup
+    warmup_on_startup: bool = True
 
     # JWT Auth
     jwt_secret: str = "change-me-in-production"
@@ -20,6 +30,26 @@ class Settings(BaseSettings):
     gemini_api_key: str = ""
     groq_api_key: str = ""
 
+    # Notifications (appointment status push over SSE)
+    notifications_poll_interval_seconds: float = 5.0
+    notifications_keepalive_seconds: float = 15.0
+
+    # Home screen aggregate cache
+    home_cache_ttl_seconds: float = 30.0
+
+    # Timezone for appointment date/time strings sent without timestamp or offset
+    appointment_timezone: str = "Asia/Kolkata"
+
+    # Data retention / archival
+    archive_enabled: bool = True
+    archive_interval_hours: float = 24.0
+    archive_export_dir: str = ""  # optional gzipped JSONL copy; use a persistent volume
+    archive_batch_size: int = 500
+    archive_scans_after_days: int = 180
+    archive_messages_after_days: int = 365
+    archive_appointments_after_days: int = 365
+    archive_ttl_days: int = 0  # 0 = keep archived records forever
+
     # CORS
     cors_origins: str = "*"
 
@@ -2,7 +2,9 @@
 HemaV Backend - MongoDB Database Connection
 Uses Motor (async MongoDB driver) for non-blocking DB operations
 """
+import threading
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
 from app.config import get_settings
 
 settings = get_settings()
@@ -11,16 +13,81 @@ client: AsyncIOMotorClient = None
 db = None
 
 
+class PoolStats(monitoring.ConnectionPoolListener):
+    """Tracks connection pool usage per server from driver events (read by app.health).
+    The driver keeps one pool per server address, each capped at maxPoolSize.
+    Motor runs pymongo on executor threads, so callbacks arrive concurrently."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open_by_address: dict = {}
+        self.checked_out_by_address: dict = {}
+        self.checkout_failures = 0
+
+    @property
+    def open(self) -> int:
+        with self._lock:
+            return sum(self.open_by_address.values())
+
+    @property
+    def checked_out(self) -> int:
+        with self._lock:
+            return sum(self.checked_out_by_address.values())
+
+    @property
+    def max_checked_out(self) -> int:
+        """Busiest single pool; what maxPoolSize actually limits"""
+        with self._lock:
+            return max(self.checked_out_by_address.values(), default=0)
+
+    def _add(self, counts: dict, address, delta: int):
+        with self._lock:
+            counts[address] = max(0, counts.get(address, 0) + delta)
+
+    def connection_created(self, event):
+        self._add(self.open_by_address, event.address, 1)
+
+    def connection_closed(self, event):
+        self._add(self.open_by_address, event.address, -1)
+
+    def connection_checked_out(self, event):
+        self._add(self.checked_out_by_address, event.address, 1)
+
+    def connection_checked_in(self, event):
+        self._add(self.checked_out_by_address, event.address, -1)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures += 1
+
+    def pool_closed(self, event):
+        with self._lock:
+            self.open_by_address.pop(event.address, None)
+            self.checked_out_by_address.pop(event.address, None)
+
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_check_out_started(self, event): pass
+
+
+pool_stats = PoolStats()
+
+
 async def connect_db():
     """Initialize MongoDB connection on startup"""
     global client, db
     client = AsyncIOMotorClient(
         settings.mongodb_uri,
-        serverSelectionTimeoutMS=5000  # Fail fast if unreachable
+        serverSelectionTimeoutMS=5000,  # Fail fast if unreachable
+        minPoolSize=settings.mongodb_min_pool_size,
+        maxPoolSize=settings.mongodb_max_pool_size,
+        event_listeners=[pool_stats],
     )
     db = client[settings.db_name]
     print(f"✅ MongoDB client initialized for: {settings.db_name}")
-    # Note: actual connection happens on first query (lazy)
+    # Note: connections open lazily; app.startup.warmup pre-opens the pool
 
 
 async def close_db():
@@ -60,3 +127,9 @@ def messages_collection():
 
 def forum_posts_collection():
     return db["forum_posts"]
+
+def archive_collection(name: str):
+    return db[f"{name}_archive"]
+
+def archive_state_collection():
+    return db["archive_state"]
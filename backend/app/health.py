@@ -0,0 +1,116 @@
+"""
+HemaV Backend - Health Monitor
+Samples MongoDB latency and pool saturation on an interval so probes only read
+a cached snapshot and never add load to the database during an outage.
+Readiness flips to false on SIGTERM, giving load balancers time to drain the
+instance before uvicorn stops accepting connections.
+"""
+import asyncio
+import signal
+import time
+from datetime import datetime
+from typing import Optional
+from app.config import get_settings
+from app import database
+from app.notifications import close_streams
+
+settings = get_settings()
+
+_monitor: Optional[asyncio.Task] = None
+_started = False
+_draining = False
+
+snapshot: dict = {
+    "db_connected": False,
+    "db_latency_ms": None,
+    "pool_open": 0,
+    "pool_checked_out": 0,
+    "pool_saturation": 0.0,
+    "pool_checkout_failures": 0,
+    "sampled_at": None,
+}
+
+
+async def _sample():
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(
+            database.client.admin.command("ping"),
+            timeout=settings.health_check_timeout_seconds,
+        )
+        snapshot["db_connected"] = True
+        snapshot["db_latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    except Exception:
+        snapshot["db_connected"] = False
+        snapshot["db_latency_ms"] = None
+
+    stats = database.pool_stats
+    snapshot["pool_open"] = stats.open
+    snapshot["pool_checked_out"] = stats.checked_out
+    # maxPoolSize applies per server, so report the busiest pool rather than the sum
+    snapshot["pool_saturation"] = round(stats.max_checked_out / max(1, settings.mongodb_max_pool_size), 3)
+    snapshot["pool_checkout_failures"] = stats.checkout_failures
+    snapshot["sampled_at"] = datetime.utcnow()
+
+
+async def _run():
+    while True:
+        await asyncio.sleep(settings.health_check_interval_seconds)
+        await _sample()
+
+
+def is_ready() -> bool:
+    """O(1) readiness: started, not draining, and the last sample was healthy"""
+    if not _started or _draining or not snapshot["db_connected"]:
+        return False
+    age = (datetime.utcnow() - snapshot["sampled_at"]).total_seconds()
+    return age < settings.health_check_interval_seconds * 3
+
+
+def start_drain():
+    global _draining
+    if not _draining:
+        _draining = True
+        # Long-lived SSE streams would otherwise hold uvicorn's graceful shutdown open
+        close_streams()
+        print("🚦 Draining: readiness now reports not ready")
+
+
+def _install_drain_handler():
+    """Flip readiness on SIGTERM, then hand off to uvicorn's handler after the drain delay"""
+    previous = signal.getsignal(signal.SIGTERM)
+    if not callable(previous):
+        return
+    loop = asyncio.get_running_loop()
+
+    def handle_sigterm(signum, frame):
+        loop.call_soon_threadsafe(start_drain)
+        loop.call_soon_threadsafe(
+            loop.call_later, settings.shutdown_drain_seconds, previous, signum, frame
+        )
+
+    try:
+        signal.signal(signal.SIGTERM, handle_sigterm)
+    except ValueError:
+        pass  # Not on the main thread (e.g. embedded in tests)
+
+
+async def start_health_monitor():
+    """Take a first sample, then keep sampling in the background"""
+    global _monitor, _started
+    await _sample()
+    _monitor = asyncio.create_task(_run())
+    _install_drain_handler()
+    _started = True
+
+
+async def stop_health_monitor():
+    global _monitor
+    start_drain()
+    if _monitor is not None:
+        _monitor.cancel()
+        try:
+            await _monitor
+        except asyncio.CancelledError:
+            pass
+        _monitor = None
@@ -2,11 +2,18 @@
 HemaV Backend — Main Application Entry Point
 FastAPI server with MongoDB, JWT auth, and RESTful APIs
 """
+import asyncio
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.config import get_settings
+from app.models import HealthResponse
 from app.database import connect_db, close_db
+from app.archival import start_archival, stop_archival
+from app.health import snapshot, is_ready, start_health_monitor, stop_health_monitor
+from app.notifications import start_notifications, stop_notifications
+from app.startup import phase, import_timed, print_report, warmup
 
 settings = get_settings()
 
@@ -14,8 +21,21 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup / shutdown events"""
-    await connect_db()
+    with phase("connect mongodb"):
+        await connect_db()
+    if settings.warmup_on_startup:
+        await warmup(app)
+    await start_notifications()
+    await start_archival()
+    await start_health_monitor()
+    from app.routes.appointments import backfill_timestamps
+    backfill = asyncio.create_task(backfill_timestamps())
+    print_report()
     yield
+    backfill.cancel()
+    await stop_health_monitor()
+    await stop_archival()
+    await stop_notifications()
     await close_db()
 
 
@@ -36,17 +56,18 @@ app.add_middleware(
 )
 
 # ─── Register Routes ─────────────────────────────────
-from app.routes.auth import router as auth_router
-from app.routes.users import router as users_router
-from app.routes.appointments import router as appointments_router
-from app.routes.scans import router as scans_router
-from app.routes.prescriptions import router as prescriptions_router
+ROUTERS = [
+    "app.routes.auth",
+    "app.routes.users",
+    "app.routes.appointments",
+    "app.routes.scans",
+    "app.routes.prescriptions",
+    "app.routes.notifications",
+    "app.routes.home",
+]
 
-app.include_router(auth_router)
-app.include_router(users_router)
-app.include_router(appointments_router)
-app.include_router(scans_router)
-app.include_router(prescriptions_router)
+for module in ROUTERS:
+    app.include_router(import_timed(module).router)
 
 
 # ─── Health Check ─────────────────────────────────────
@@ -60,17 +81,27 @@ async def root():
     }
 
 
-@app.get("/health", tags=["Health"])
+@app.get("/health", tags=["Health"], response_model=HealthResponse)
 async def health_check():
-    from app.database import client
-    try:
-        await client.admin.command("ping")
-        db_ok = True
-    except Exception:
-        db_ok = False
-
+    """Cached dependency health; never queries MongoDB directly"""
     return {
-        "status": "ok" if db_ok else "degraded",
+        "status": "ok" if snapshot["db_connected"] else "degraded",
         "version": "1.0.0-poc",
-        "db_connected": db_ok,
+        **snapshot,
     }
+
+
+@app.get("/livez", tags=["Health"])
+async def liveness():
+    """Process is up and the event loop is responsive"""
+    return {"status": "ok"}
+
+
+@app.get("/readyz", tags=["Health"])
+async def readiness():
+    """Ready to take traffic; 503 while starting, draining or when MongoDB is down"""
+    ready = is_ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "not_ready"},
+    )
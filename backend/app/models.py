@@ -109,6 +109,8 @@ class AppointmentCreate(BaseModel):
     patient_gender: str = ""
     patient_blood_group: str = ""
     patient_weight: str = ""
+    timestamp: int = 0  # scheduled time in epoch ms, as computed by the app
+    utc_offset_minutes: Optional[int] = None  # client's offset, used if timestamp is absent
 
 
 class AppointmentOut(BaseModel):
@@ -190,3 +192,9 @@ class HealthResponse(BaseModel):
     status: str = "ok"
     version: str = "1.0.0-poc"
     db_connected: bool = False
+    db_latency_ms: Optional[float] = None
+    pool_open: int = 0
+    pool_checked_out: int = 0
+    pool_saturation: float = 0.0
+    pool_checkout_failures: int = 0
+    sampled_at: Optional[datetime] = None
@@ -0,0 +1,234 @@
+"""
+HemaV Backend - Appointment Notifications
+Tails appointment changes and fans status events out to per-user subscribers.
+Uses Mongo change streams when available (replica sets / Atlas) and falls back
+to polling `updated_at` on standalone servers.
+
+Each SSE event carries its appointment's `updated_at` as the event id. Clients
+that reconnect send it back as `Last-Event-ID` and get a catch-up query via
+`missed_events`, so nothing is lost across client disconnects or server
+restarts. The watcher's own position is only kept in memory to resume after
+transient errors; there are no subscribers to replay to after a restart.
+On shutdown `close_streams` ends open streams so clients reconnect elsewhere.
+"""
+import asyncio
+import json
+from datetime import datetime
+from typing import Optional
+from pymongo.errors import OperationFailure, PyMongoError
+from app.cache import invalidate_user
+from app.config import get_settings
+from app.database import appointments_collection
+
+settings = get_settings()
+
+QUEUE_SIZE = 100
+
+# Server error codes: resume position unusable (ChangeStreamHistoryLost,
+# ChangeStreamFatalError on older servers, InvalidResumeToken)
+CHANGE_STREAM_RESUME_FAILED = {286, 280, 260}
+CHANGE_STREAM_UNSUPPORTED = {40573, 40324}
+
+# user_id -> set of subscriber queues (one per open SSE connection)
+_subscribers: dict[str, set[asyncio.Queue]] = {}
+_watcher: Optional[asyncio.Task] = None
+_closing = asyncio.Event()
+
+# In-memory watcher position: change stream resume token or last polled updated_at
+_resume_token = None
+_polled_until: Optional[datetime] = None
+
+
+# ─── Subscriptions ────────────────────────────────────
+def subscribe(user_id: str) -> asyncio.Queue:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    _subscribers.setdefault(user_id, set()).add(queue)
+    return queue
+
+
+def unsubscribe(user_id: str, queue: asyncio.Queue):
+    queues = _subscribers.get(user_id)
+    if queues is None:
+        return
+    queues.discard(queue)
+    if not queues:
+        _subscribers.pop(user_id, None)
+
+
+def close_streams():
+    """End every open SSE stream and refuse new ones (called when draining)"""
+    _closing.set()
+
+
+def streams_closing() -> bool:
+    return _closing.is_set()
+
+
+async def wait_event(queue: asyncio.Queue) -> Optional[dict]:
+    """Next event, or None after the keepalive interval or once streams are closing"""
+    getter = asyncio.ensure_future(queue.get())
+    closer = asyncio.ensure_future(_closing.wait())
+    done, _ = await asyncio.wait(
+        {getter, closer},
+        timeout=settings.notifications_keepalive_seconds,
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    closer.cancel()
+    if getter in done:
+        return getter.result()
+    getter.cancel()
+    return None
+
+
+def _deliver(user_id: str, event: dict):
+    for queue in _subscribers.get(user_id, ()):
+        if queue.full():
+            # Slow client: drop the oldest event rather than block the watcher
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+
+def appointment_event(doc: dict) -> dict:
+    updated_at = doc.get("updated_at") or doc.get("created_at")
+    return {
+        "type": "appointment_status",
+        "id": format_event_id(updated_at) if updated_at else None,
+        "appointment_id": str(doc["_id"]),
+        "status": doc.get("status", ""),
+        "date": doc.get("date", ""),
+        "time": doc.get("time", ""),
+        "patient_name": doc.get("patient_name", ""),
+        "doctor_name": doc.get("doctor_name", ""),
+        "updated_at": updated_at,
+    }
+
+
+def publish_appointment(doc: dict):
+    """Push an appointment status event to its patient and doctor"""
+    # Also catches writes made by other workers/instances
+    invalidate_user(doc.get("patient_id"), doc.get("doctor_id"))
+    event = appointment_event(doc)
+    for user_id in {doc.get("patient_id"), doc.get("doctor_id")}:
+        if user_id:
+            _deliver(user_id, event)
+
+
+def format_sse(event: dict) -> str:
+    id_line = f"id: {event['id']}\n" if event["id"] else ""
+    return f"{id_line}event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+# ─── Client Catch-up ──────────────────────────────────
+def format_event_id(updated_at: datetime) -> str:
+    # Mongo stores millisecond precision, so this round-trips exactly
+    return updated_at.isoformat(timespec="milliseconds")
+
+
+def parse_event_id(event_id: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(event_id)
+    except ValueError:
+        return None
+
+
+async def missed_events(user_id: str, since: datetime):
+    """Events for appointments changed after `since` (the client's Last-Event-ID).
+    Streams the whole cursor in driver batches rather than capping the catch-up."""
+    cursor = appointments_collection().find({
+        "$or": [{"patient_id": user_id}, {"doctor_id": user_id}],
+        "updated_at": {"$gt": since},
+    }).sort("updated_at", 1)
+    async for doc in cursor:
+        yield appointment_event(doc)
+
+
+def event_key(event: dict) -> tuple:
+    return event["appointment_id"], event["updated_at"]
+
+
+async def _ensure_indexes():
+    coll = appointments_collection()
+    await coll.create_index("updated_at")
+    await coll.create_index([("patient_id", 1), ("updated_at", 1)])
+    await coll.create_index([("doctor_id", 1), ("updated_at", 1)])
+
+
+# ─── Watchers ─────────────────────────────────────────
+async def _watch_change_stream():
+    global _resume_token
+    pipeline = [{"$match": {"$or": [
+        {"operationType": {"$in": ["insert", "replace"]}},
+        {"operationType": "update", "updateDescription.updatedFields.status": {"$exists": True}},
+    ]}}]
+    kwargs = {"full_document": "updateLookup"}
+    if _resume_token:
+        kwargs["resume_after"] = _resume_token
+
+    async with appointments_collection().watch(pipeline, **kwargs) as stream:
+        print("🔔 Appointment notifications: tailing change stream")
+        async for change in stream:
+            doc = change.get("fullDocument")
+            if doc:
+                publish_appointment(doc)
+            _resume_token = change["_id"]
+
+
+async def _poll_updates():
+    global _polled_until
+    if _polled_until is None:
+        _polled_until = datetime.utcnow()
+    print("🔔 Appointment notifications: polling (change streams unavailable)")
+    while True:
+        cursor = appointments_collection().find(
+            {"updated_at": {"$gt": _polled_until}}
+        ).sort("updated_at", 1)
+        async for doc in cursor:
+            publish_appointment(doc)
+            _polled_until = doc["updated_at"]
+        await asyncio.sleep(settings.notifications_poll_interval_seconds)
+
+
+async def _run():
+    global _resume_token
+    use_polling = False
+    try:
+        await _ensure_indexes()
+    except PyMongoError as e:
+        print(f"⚠️ Appointment notification index setup failed: {e}")
+    while True:
+        try:
+            if use_polling:
+                await _poll_updates()
+            else:
+                await _watch_change_stream()
+        except OperationFailure as e:
+            if e.code in CHANGE_STREAM_UNSUPPORTED:
+                use_polling = True
+                continue
+            if e.code in CHANGE_STREAM_RESUME_FAILED:
+                # Token fell off the oplog or is invalid; restart from "now"
+                _resume_token = None
+                continue
+            print(f"⚠️ Appointment notifications error: {e}")
+        except PyMongoError as e:
+            print(f"⚠️ Appointment notifications error: {e}")
+        await asyncio.sleep(settings.notifications_poll_interval_seconds)
+
+
+async def start_notifications():
+    """Start the background appointment watcher on startup"""
+    global _watcher
+    if _watcher is None:
+        _watcher = asyncio.create_task(_run())
+
+
+async def stop_notifications():
+    """Stop the background appointment watcher on shutdown"""
+    global _watcher
+    if _watcher is not None:
+        _watcher.cancel()
+        try:
+            await _watcher
+        except asyncio.CancelledError:
+            pass
+        _watcher = None
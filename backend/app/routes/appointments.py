@@ -3,13 +3,79 @@ HemaV Backend - Appointment Routes
 """
 from fastapi import APIRouter, Depends, HTTPException
 from app.auth import get_current_user
+from app.cache import invalidate_user
+from app.config import get_settings
 from app.database import appointments_collection, users_collection, doctors_collection
+from app.archival import read_archive
 from app.models import AppointmentCreate, AppointmentOut, AppointmentStatus
 from bson import ObjectId
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+settings = get_settings()
 
 router = APIRouter(prefix="/appointments", tags=["Appointments"])
 
+# ISO-style dates; the app's own "Mon, Feb 17" + "09:00 AM" carries no year
+DATE_FORMATS = ["%Y-%m-%d %H:%M", "%Y-%m-%d %I:%M %p", "%Y-%m-%d"]
+APP_DATE_FORMAT = "%a, %b %d %Y %I:%M %p"
+
+
+def scheduled_timestamp(
+    date: str,
+    time: str,
+    booked_at: datetime,
+    utc_offset_minutes: Optional[int] = None,
+) -> int:
+    """Sortable scheduled time in epoch ms, parsed from the local wall-clock
+    date/time. Uses the client's UTC offset when sent, else the configured
+    appointment_timezone. Returns 0 if unparseable."""
+    text = f"{date} {time}".strip()
+    scheduled = None
+    for fmt in DATE_FORMATS:
+        try:
+            scheduled = datetime.strptime(text, fmt)
+            break
+        except ValueError:
+            pass
+    if scheduled is None:
+        try:
+            scheduled = datetime.strptime(f"{date} {booked_at.year} {time}", APP_DATE_FORMAT)
+            if scheduled < booked_at - timedelta(days=1):
+                # "Jan 05" booked in December means next year
+                scheduled = scheduled.replace(year=booked_at.year + 1)
+        except ValueError:
+            return 0
+
+    if utc_offset_minutes is not None:
+        tz = timezone(timedelta(minutes=utc_offset_minutes))
+    else:
+        tz = ZoneInfo(settings.appointment_timezone)
+    return int(scheduled.replace(tzinfo=tz).timestamp() * 1000)
+
+
+async def backfill_timestamps():
+    """One-off: give appointments created before `timestamp` existed a
+    scheduled time, so they are not missing from /home"""
+    try:
+        cursor = appointments_collection().find(
+            {"timestamp": {"$exists": False}}, {"date": 1, "time": 1, "created_at": 1}
+        )
+        updates = [
+            UpdateOne({"_id": doc["_id"]}, {"$set": {"timestamp": scheduled_timestamp(
+                doc.get("date", ""), doc.get("time", ""), doc.get("created_at") or datetime.utcnow()
+            )}})
+            async for doc in cursor
+        ]
+        if updates:
+            await appointments_collection().bulk_write(updates, ordered=False)
+            print(f"🗓️ Backfilled scheduled time on {len(updates)} appointments")
+    except PyMongoError as e:
+        print(f"⚠️ Appointment timestamp backfill failed: {e}")
+
 
 @router.post("/", response_model=AppointmentOut)
 async def create_appointment(
@@ -29,6 +95,9 @@ async def create_appointment(
         "doctor_name": doctor.get("name", ""),
         "date": data.date,
         "time": data.time,
+        "timestamp": data.timestamp or scheduled_timestamp(
+            data.date, data.time, datetime.utcnow(), data.utc_offset_minutes
+        ),
         "type": data.type.value,
         "status": AppointmentStatus.PENDING.value,
         "notes": data.notes,
@@ -37,9 +106,11 @@ async def create_appointment(
         "patient_blood_group": data.patient_blood_group,
         "patient_weight": data.patient_weight,
         "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
     }
 
     result = await appointments_collection().insert_one(doc)
+    invalidate_user(current_user["user_id"], data.doctor_id)
     doc["id"] = str(result.inserted_id)
     return AppointmentOut(**doc)
 
@@ -52,8 +123,11 @@ async def list_appointments(current_user: dict = Depends(get_current_user)):
     query = {"patient_id": user_id} if role == "PATIENT" else {"doctor_id": user_id}
     cursor = appointments_collection().find(query).sort("created_at", -1).limit(50)
 
+    docs = [doc async for doc in cursor]
+    docs += await read_archive("appointments", query, limit=50 - len(docs))
+
     appointments = []
-    async for doc in cursor:
+    for doc in docs:
         doc["id"] = str(doc["_id"])
         doc.pop("_id", None)
         appointments.append(doc)
@@ -66,10 +140,14 @@ async def update_status(
     status: AppointmentStatus,
     current_user: dict = Depends(get_current_user),
 ):
-    result = await appointments_collection().update_one(
-        {"_id": ObjectId(appointment_id)},
-        {"$set": {"status": status.value}},
+    """Set status and bump `updated_at` (drives notifications). Setting the
+    current status again is a no-op and returns 404, as before."""
+    doc = await appointments_collection().find_one_and_update(
+        {"_id": ObjectId(appointment_id), "status": {"$ne": status.value}},
+        {"$set": {"status": status.value, "updated_at": datetime.utcnow()}},
+        projection={"patient_id": 1, "doctor_id": 1},
     )
-    if result.modified_count == 0:
+    if doc is None:
         raise HTTPException(status_code=404, detail="Appointment not found")
+    invalidate_user(doc.get("patient_id"), doc.get("doctor_id"))
     return {"status": "updated"}
@@ -0,0 +1,92 @@
+"""
+HemaV Backend - Home Screen Route
+One request for the app's home screen: profile, next appointment, latest
+prescription and latest scan, queried concurrently and cached per user.
+"""
+import asyncio
+import time
+from fastapi import APIRouter, Depends, HTTPException
+from app.auth import get_current_user
+from app.cache import get_home, set_home, home_generation
+from app.database import users_collection, appointments_collection, prescriptions_collection, scans_collection
+from app.archival import find_archived
+from app.models import AppointmentStatus
+from bson import ObjectId
+
+router = APIRouter(prefix="/home", tags=["Home"])
+
+ACTIVE_STATUSES = [AppointmentStatus.PENDING.value, AppointmentStatus.CONFIRMED.value]
+
+
+def _with_id(doc):
+    if doc is None:
+        return None
+    doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
+APPOINTMENT_FIELDS = {
+    "doctor_id": 1, "doctor_name": 1, "patient_name": 1, "date": 1, "time": 1,
+    "timestamp": 1, "type": 1, "status": 1,
+}
+
+
+async def _next_appointment(field: str, user_id: str, now_ms: int):
+    """Earliest upcoming active appointment. Falls back to the newest active
+    booking with no usable scheduled time (unparseable or not backfilled yet)."""
+    query = {field: user_id, "status": {"$in": ACTIVE_STATUSES}}
+    doc = await appointments_collection().find_one(
+        {**query, "timestamp": {"$gte": now_ms}}, APPOINTMENT_FIELDS, sort=[("timestamp", 1)]
+    )
+    if doc is None:
+        doc = await appointments_collection().find_one(
+            {**query, "timestamp": {"$in": [0, None]}}, APPOINTMENT_FIELDS, sort=[("created_at", -1)]
+        )
+    return doc
+
+
+async def _latest_scan(user_id: str):
+    query = {"user_id": user_id}
+    projection = {"risk_level": 1, "confidence": 1, "hemoglobin_estimate": 1, "created_at": 1}
+    doc = await scans_collection().find_one(query, projection, sort=[("created_at", -1)])
+    if doc is None:
+        doc = await find_archived("scans", query)
+        if doc is not None:
+            doc = {k: doc[k] for k in ["_id", *projection] if k in doc}
+    return doc
+
+
+@router.get("/")
+async def get_home_summary(current_user: dict = Depends(get_current_user)):
+    user_id = current_user["user_id"]
+    cached = get_home(user_id)
+    if cached is not None:
+        return cached
+    generation = home_generation(user_id)
+    now_ms = int(time.time() * 1000)
+
+    field = "patient_id" if current_user["role"] == "PATIENT" else "doctor_id"
+    user, appointment, prescription, scan = await asyncio.gather(
+        users_collection().find_one(
+            {"_id": ObjectId(user_id)},
+            {"name": 1, "email": 1, "role": 1, "profile_pic_url": 1},
+        ),
+        _next_appointment(field, user_id, now_ms),
+        prescriptions_collection().find_one(
+            {field: user_id},
+            {"doctor_name": 1, "diagnosis": 1, "medicines": 1, "created_at": 1},
+            sort=[("created_at", -1)],
+        ),
+        _latest_scan(user_id),
+    )
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    summary = {
+        "user": _with_id(user),
+        "next_appointment": _with_id(appointment),
+        "latest_prescription": _with_id(prescription),
+        "latest_scan": _with_id(scan),
+    }
+    set_home(user_id, summary, generation)
+    return summary
@@ -0,0 +1,47 @@
+"""
+HemaV Backend - Notification Routes (Server-Sent Events)
+"""
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from app.auth import get_current_user
+from app.notifications import (
+    subscribe, unsubscribe, format_sse, parse_event_id, missed_events,
+    event_key, wait_event, streams_closing,
+)
+
+router = APIRouter(prefix="/notifications", tags=["Notifications"])
+
+
+@router.get("/stream")
+async def stream_notifications(request: Request, current_user: dict = Depends(get_current_user)):
+    """Long-lived SSE stream of appointment status events for the current user.
+    Reconnecting clients send `Last-Event-ID` to receive what they missed."""
+    user_id = current_user["user_id"]
+    since = parse_event_id(request.headers.get("last-event-id", ""))
+    # Subscribe before the catch-up query so no update falls in between
+    queue = subscribe(user_id)
+
+    async def events():
+        caught_up = set()
+        try:
+            if since is not None:
+                async for event in missed_events(user_id, since):
+                    yield format_sse(event)
+                    caught_up.add(event_key(event))
+            while not streams_closing() and not await request.is_disconnected():
+                event = await wait_event(queue)
+                if event is None:
+                    if not streams_closing():
+                        yield ": keepalive\n\n"
+                    continue
+                if event_key(event) in caught_up:
+                    continue  # Already sent during catch-up
+                yield format_sse(event)
+        finally:
+            unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
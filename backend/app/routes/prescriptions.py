@@ -3,6 +3,7 @@ HemaV Backend - Prescription Routes
 """
 from fastapi import APIRouter, Depends, HTTPException
 from app.auth import get_current_user
+from app.cache import invalidate_user
 from app.database import prescriptions_collection, users_collection
 from app.models import PrescriptionCreate
 from bson import ObjectId
@@ -33,6 +34,7 @@ async def create_prescription(
         "created_at": datetime.utcnow(),
     }
     result = await prescriptions_collection().insert_one(doc)
+    invalidate_user(data.patient_id, current_user["user_id"])
     return {"id": str(result.inserted_id), "status": "created"}
 
 
@@ -3,7 +3,9 @@ HemaV Backend - Scan Results Routes
 """
 from fastapi import APIRouter, Depends
 from app.auth import get_current_user
+from app.cache import invalidate_user
 from app.database import scans_collection
+from app.archival import read_archive, find_archived
 from app.models import ScanResultOut
 from datetime import datetime
 
@@ -29,6 +31,7 @@ async def save_scan_result(
         "created_at": datetime.utcnow(),
     }
     result = await scans_collection().insert_one(doc)
+    invalidate_user(current_user["user_id"])
     return {"id": str(result.inserted_id), "status": "saved"}
 
 
@@ -39,8 +42,11 @@ async def list_scans(current_user: dict = Depends(get_current_user)):
         {"user_id": current_user["user_id"]}
     ).sort("created_at", -1).limit(50)
 
+    docs = [doc async for doc in cursor]
+    docs += await read_archive("scans", {"user_id": current_user["user_id"]}, limit=50 - len(docs))
+
     scans = []
-    async for doc in cursor:
+    for doc in docs:
         doc["id"] = str(doc["_id"])
         doc.pop("_id", None)
         scans.append(doc)
@@ -51,6 +57,8 @@ async def list_scans(current_user: dict = Depends(get_current_user)):
 async def get_scan(scan_id: str, current_user: dict = Depends(get_current_user)):
     from bson import ObjectId
     doc = await scans_collection().find_one({"_id": ObjectId(scan_id)})
+    if not doc:
+        doc = await find_archived("scans", {"_id": ObjectId(scan_id)})
     if not doc:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Scan not found")
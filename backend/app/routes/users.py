@@ -3,6 +3,7 @@ HemaV Backend - User & Profile Routes
 """
 from fastapi import APIRouter, Depends, HTTPException
 from app.auth import get_current_user
+from app.cache import invalidate_user
 from app.database import users_collection, doctors_collection
 from app.models import PatientProfileUpdate, DoctorProfileCreate, DoctorProfileOut
 from bson import ObjectId
@@ -31,6 +32,7 @@ async def update_patient_profile(
         {"_id": ObjectId(current_user["user_id"])},
         {"$set": data.model_dump()},
     )
+    invalidate_user(current_user["user_id"])
     return {"status": "updated"}
 
 
@@ -44,6 +46,7 @@ async def update_doctor_profile(
         {"$set": data.model_dump()},
         upsert=True,
     )
+    invalidate_user(current_user["user_id"])
     return {"status": "updated"}
 
 
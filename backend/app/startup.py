@@ -0,0 +1,139 @@
+"""
+HemaV Backend - Startup Profiling & Warmup
+Records how long each startup phase takes (router imports, DB connect, warmup)
+and pre-pays first-request costs before the app reports itself ready.
+
+Run `python -m app.startup` for an import-time breakdown of the heavy
+dependencies and app modules, measured with `-X importtime` in a fresh
+interpreter so nothing is already cached in `sys.modules`.
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Optional
+from app.config import get_settings
+
+settings = get_settings()
+
+# phase name -> duration in milliseconds, in the order phases finished
+timings: dict[str, float] = {}
+# phase name -> enclosing phase (None for top level); children are not re-counted
+parents: dict[str, Optional[str]] = {}
+_active: list[str] = []
+
+# Third-party modules that dominate import time, in dependency order
+HEAVY_MODULES = [
+    "pydantic",
+    "email_validator",
+    "fastapi",
+    "motor.motor_asyncio",
+    "passlib.context",
+    "jose.jwt",
+]
+
+
+@contextmanager
+def phase(name: str):
+    """Time a startup phase and record it in `timings`"""
+    parents[name] = _active[-1] if _active else None
+    _active.append(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _active.pop()
+        timings[name] = (time.perf_counter() - start) * 1000
+
+
+def import_timed(module: str):
+    # __import__ (not importlib.import_module) so `-X importtime` records it too
+    with phase(f"import {module}"):
+        __import__(module)
+    return sys.modules[module]
+
+
+def print_report():
+    total = sum(ms for name, ms in timings.items() if parents.get(name) is None)
+    print(f"⏱️ Startup breakdown ({total:.0f} ms total):")
+
+    def print_children(parent: Optional[str], depth: int):
+        children = [name for name in timings if parents.get(name) == parent]
+        for name in sorted(children, key=timings.get, reverse=True):
+            print(f"   {timings[name]:8.1f} ms  {'  ' * depth}{name}")
+            print_children(name, depth + 1)
+
+    print_children(None, 0)
+
+
+def import_time_report(target: str = "app.main"):
+    """Cumulative import time per module from `python -X importtime` in a clean interpreter"""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=backend_dir, capture_output=True, text=True,
+    )
+    cumulative: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, _, module = line.split("|", 2)
+        cumulative[module.strip()] = int(line.split("|")[1]) / 1000
+    if target not in cumulative:
+        print(result.stderr)
+        return
+
+    print(f"⏱️ Import breakdown for {target} ({cumulative[target]:.0f} ms total):")
+    for module in HEAVY_MODULES:
+        if module in cumulative:
+            print(f"   {cumulative[module]:8.1f} ms  {module}")
+    app_modules = [m for m in cumulative if m.startswith("app.") and m != target]
+    for module in sorted(app_modules, key=cumulative.get, reverse=True):
+        print(f"   {cumulative[module]:8.1f} ms  {module}")
+
+
+# ─── Warmup ───────────────────────────────────────────
+async def _warm_db():
+    """Force server selection and pre-open pooled connections"""
+    from app.database import client
+    pings = [client.admin.command("ping") for _ in range(max(1, settings.mongodb_min_pool_size))]
+    try:
+        await asyncio.gather(*pings)
+    except Exception as e:
+        # Keep the old lazy behaviour if Mongo is not reachable yet
+        print(f"⚠️ MongoDB warmup failed: {e}")
+
+
+def _warm_auth():
+    """Load the bcrypt and jose crypto backends. No real hash: bcrypt has nothing
+    to warm beyond its backend, and a hash costs ~0.3 s of restart-to-ready."""
+    from app.auth import get_pwd_context, create_token, decode_token
+    get_pwd_context().handler("bcrypt").get_backend()
+    decode_token(create_token("warmup", "PATIENT"))
+
+
+def _warm_models():
+    """Exercise request-model validators (incl. email validation)"""
+    from app.models import UserRegister, UserLogin, AppointmentCreate, PrescriptionCreate
+    UserRegister.model_validate({"name": "warmup", "email": "warmup@example.com", "password": "x"})
+    UserLogin.model_validate({"email": "warmup@example.com", "password": "x"})
+    AppointmentCreate.model_validate({"doctor_id": "x", "date": "", "time": ""})
+    PrescriptionCreate.model_validate({"patient_id": "x", "medicines": [{"name": "x"}]})
+
+
+async def warmup(app):
+    """Pre-pay first-request costs; runs before startup completes"""
+    with phase("warmup mongodb"):
+        await _warm_db()
+    with phase("warmup auth"):
+        await asyncio.to_thread(_warm_auth)
+    with phase("warmup models"):
+        _warm_models()
+    with phase("warmup openapi"):
+        app.openapi()
+
+
+if __name__ == "__main__":
+    import_time_report()
@@ -44,7 +44,7 @@ User=root
 WorkingDirectory=/opt/hemav-backend
 Environment=PATH=/opt/hemav-backend/venv/bin:/usr/bin:/bin
 EnvironmentFile=/opt/hemav-backend/.env
-ExecStart=/opt/hemav-backend/venv/bin/uvicorn app.main:app --host 0.0.0.0 --port 8000
+ExecStart=/opt/hemav-backend/venv/bin/uvicorn app.main:app --host 0.0.0.0 --port 8000 --timeout-graceful-shutdown 15
 Restart=always
 RestartSec=5
 